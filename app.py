@@ -6,29 +6,47 @@ This is the main CDK application that defines and synthesizes the infrastructure
 for a serverless Flask-based todo application using AWS Lambda, API Gateway, and DynamoDB.
 """
 
-import aws_cdk as cdk
-from infrastructure.todo_stack import TodoStack
+import os
 
-# Create CDK app instance
-app = cdk.App()
+# Skip capturing a stack trace for every construct created during synthesis;
+# the traces are only useful when debugging the CDK itself. This must be set
+# before aws_cdk is imported, since the import starts the jsii runtime process
+# with a copy of the environment.
+os.environ.setdefault("CDK_DISABLE_STACK_TRACE", "1")
+
+# Only import what the entry point uses; service submodules such as
+# aws_cdk.aws_dynamodb are loaded by the stacks when they are instantiated.
+from aws_cdk import App, Environment  # noqa: E402
+from infrastructure import TodoStack  # noqa: E402
+
+# Create CDK app instance; version reporting is disabled so stacks do not
+# carry an AWS::CDK::Metadata resource
+app = App(
+    analytics_reporting=False,
+    context={"aws:cdk:disable-stack-trace": True}
+)
 
 # Development environment stack
 TodoStack(app, "FlaskTodoCdkDev",
-    env=cdk.Environment(
+    is_prod=False,
+    env=Environment(
         account=app.node.try_get_context("account"),
         region=app.node.try_get_context("region") or "us-east-1"
     ),
     description="Flask Todo CDK Development Stack - Serverless todo app with Lambda, API Gateway, and DynamoDB"
 )
 
-# Production environment stack (commented out for now)
-# TodoStack(app, "FlaskTodoCdkProd",
-#     env=cdk.Environment(
-#         account=app.node.try_get_context("prod_account"),
-#         region=app.node.try_get_context("prod_region") or "us-east-1"
-#     ),
-#     description="Flask Todo CDK Production Stack"
-# )
+# Production environment stack, only synthesized when requested with
+# `cdk synth -c prod=1`
+if str(app.node.try_get_context("prod") or "").lower() in ("1", "true", "yes"):
+    TodoStack(app, "FlaskTodoCdkProd",
+        is_prod=True,
+        env=Environment(
+            account=app.node.try_get_context("prod_account"),
+            region=app.node.try_get_context("prod_region") or "us-east-1"
+        ),
+        description="Flask Todo CDK Production Stack"
+    )
 
 # Synthesize the CDK app
 app.synth()
\ No newline at end of file
@@ -3,10 +3,29 @@ Infrastructure package for Flask Todo CDK application.
 
 This package contains all CDK stack definitions and infrastructure components
 for the serverless Flask todo application.
+
+Stack classes are resolved lazily on first attribute access so that importing
+the package does not pull in the stack modules (and their aws_cdk submodules)
+until they are actually needed.
 """
 
-from .database_stack import DatabaseStack
-from .todo_stack import TodoStack
+import importlib
 
 __version__ = "1.0.0"
-__all__ = ["DatabaseStack", "TodoStack"]
\ No newline at end of file
+__all__ = ["DatabaseStack", "TodoStack"]
+
+# Maps each exported name to the submodule that defines it
+_LAZY_EXPORTS = {
+    "DatabaseStack": ".database_stack",
+    "TodoStack": ".todo_stack",
+}
+
+
+def __getattr__(name: str):
+    """Import stack classes on first access."""
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,102 +1,172 @@
 """
 DynamoDB Stack for Flask Todo Application
 
-This stack creates the DynamoDB table infrastructure for storing todo items
-with proper GSI configuration and IAM permissions for Lambda access.
+This nested stack creates the DynamoDB table infrastructure for storing todo
+items with proper GSI configuration and IAM permissions for Lambda access.
 """
 
+from functools import lru_cache
+from typing import Optional
+
 from aws_cdk import (
-    Stack,
-    aws_dynamodb as dynamodb,
-    aws_iam as iam,
+    NestedStack,
     RemovalPolicy,
     CfnOutput,
+    Fn,
     Tags
 )
 from constructs import Construct
 
 
-class DatabaseStack(Stack):
+# Value of the Project tag on every stack and resource
+PROJECT_TAG = "flask-todo-cdk"
+
+# Non-key attributes projected into StatusDateIndex; these are the todo
+# fields served by GET /todos?status=...
+_GSI_PROJECTED_ATTRIBUTES = ("title", "description", "updated_at")
+
+# Every todo item carries entity_type = "todo", giving CreatedAtIndex a single
+# partition that can be queried newest-first without a Scan
+_CREATED_AT_INDEX_ATTRIBUTES = _GSI_PROJECTED_ATTRIBUTES + ("status",)
+
+
+def table_name_for(environment: str) -> str:
+    """Return the physical name of the todo table for an environment."""
+    return f"flask-todo-{environment}"
+
+
+def lambda_role_name_for(environment: str) -> str:
+    """Return the physical name of the Lambda DynamoDB role for an environment."""
+    return f"flask-todo-lambda-dynamodb-role-{environment}"
+
+
+def resolve_environment(scope: Construct, is_prod: Optional[bool]) -> str:
+    """
+    Return the deployment environment for a stack.
+
+    The "environment" context is only used when is_prod is not given. A
+    context that contradicts an explicit is_prod raises, since otherwise two
+    stacks could end up declaring the same physical table and role names.
+    """
+    context = scope.node.try_get_context("environment")
+    if is_prod is None:
+        return context or "dev"
+    if context and (context == "prod") != is_prod:
+        raise ValueError(
+            f"environment context {context!r} conflicts with is_prod={is_prod} "
+            f"for stack {scope.node.id!r}"
+        )
+    return context or ("prod" if is_prod else "dev")
+
+
+@lru_cache(maxsize=None)
+def _key_attributes():
+    """
+    Build the table and GSI key attributes once per process.
+
+    Returns:
+        Tuple of (todo_id partition key, status GSI partition key,
+        entity_type GSI partition key, created_at GSI sort key)
+    """
+    from aws_cdk import aws_dynamodb as dynamodb
+
+    return (
+        dynamodb.Attribute(name="todo_id", type=dynamodb.AttributeType.STRING),
+        dynamodb.Attribute(name="status", type=dynamodb.AttributeType.STRING),
+        dynamodb.Attribute(name="entity_type", type=dynamodb.AttributeType.STRING),
+        dynamodb.Attribute(name="created_at", type=dynamodb.AttributeType.STRING),
+    )
+
+
+class DatabaseStack(NestedStack):
     """
     DatabaseStack creates DynamoDB table infrastructure for todo storage.
+
+    It is deployed as a nested stack of TodoStack, so both are created and
+    updated in a single CloudFormation stack operation.
     
     Features:
     - TodoTable with partition key and attributes
     - StatusDateIndex GSI for querying by status and date
+    - CreatedAtIndex GSI for listing all todos by date
     - IAM permissions for Lambda access
     - Environment-specific configuration
-    - Point-in-time recovery and CloudWatch metrics
+    - Point-in-time recovery
     """
 
-    def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
+    def __init__(
+        self,
+        scope: Construct,
+        construct_id: str,
+        *,
+        is_prod: Optional[bool] = None,
+        **kwargs
+    ) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
-        # Get environment from context or default to 'dev'
-        environment = self.node.try_get_context("environment") or "dev"
-        
-        # Configure billing mode based on environment
-        billing_mode = (
-            dynamodb.BillingMode.PAY_PER_REQUEST if environment == "dev" 
-            else dynamodb.BillingMode.PROVISIONED
+        # Service submodules are imported here rather than at module level so
+        # that only synthesizing this stack pays their import cost
+        from aws_cdk import aws_dynamodb as dynamodb, aws_iam as iam
+
+        environment = resolve_environment(self, is_prod)
+        is_prod = environment == "prod"
+        (
+            pk_todo_id, gsi_pk_status, gsi_pk_entity_type, gsi_sk_created_at
+        ) = _key_attributes()
+
+        # Production-only table properties are omitted entirely, rather than
+        # passed as None, in other environments
+        table_options = (
+            {"stream": dynamodb.StreamViewType.NEW_IMAGE} if is_prod else {}
         )
-        
+
         # Create DynamoDB table for todos
         self.todo_table = dynamodb.Table(
             self, "TodoTable",
-            table_name=f"flask-todo-{environment}",
-            partition_key=dynamodb.Attribute(
-                name="todo_id",
-                type=dynamodb.AttributeType.STRING
-            ),
-            billing_mode=billing_mode,
+            table_name=table_name_for(environment),
+            partition_key=pk_todo_id,
+            # On-demand capacity suits the low, unpredictable traffic of a
+            # todo app; no throughput settings are configured
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
             # Enable point-in-time recovery for data protection
             point_in_time_recovery_specification=dynamodb.PointInTimeRecoverySpecification(
                 point_in_time_recovery_enabled=True
             ),
-            # Configure removal policy based on environment
+            # Configure removal policy based on environment. DynamoDB does not
+            # support RemovalPolicy.SNAPSHOT; with point-in-time recovery
+            # enabled, deleting the dev table leaves a system backup that can
+            # be restored after a destroy/deploy cycle.
             removal_policy=(
                 RemovalPolicy.DESTROY if environment == "dev" 
                 else RemovalPolicy.RETAIN
             ),
-            # Enable CloudWatch metrics
-            stream=dynamodb.StreamViewType.NEW_AND_OLD_IMAGES if environment == "prod" else None
+            **table_options
         )
 
-        # Add provisioned throughput for production environment
-        if environment == "prod" and billing_mode == dynamodb.BillingMode.PROVISIONED:
-            self.todo_table.add_global_secondary_index(
-                index_name="StatusDateIndex",
-                partition_key=dynamodb.Attribute(
-                    name="status",
-                    type=dynamodb.AttributeType.STRING
-                ),
-                sort_key=dynamodb.Attribute(
-                    name="created_at",
-                    type=dynamodb.AttributeType.STRING
-                ),
-                read_capacity=5,
-                write_capacity=5,
-                projection_type=dynamodb.ProjectionType.ALL
-            )
-        else:
-            # Add GSI for querying by status and creation date
-            self.todo_table.add_global_secondary_index(
-                index_name="StatusDateIndex",
-                partition_key=dynamodb.Attribute(
-                    name="status",
-                    type=dynamodb.AttributeType.STRING
-                ),
-                sort_key=dynamodb.Attribute(
-                    name="created_at",
-                    type=dynamodb.AttributeType.STRING
-                ),
-                projection_type=dynamodb.ProjectionType.ALL
-            )
+        # Add GSI for querying by status and creation date. Only the
+        # attributes returned by the list endpoint are projected, so any
+        # attributes added to items later are not copied into the index.
+        self.todo_table.add_global_secondary_index(
+            index_name="StatusDateIndex",
+            partition_key=gsi_pk_status,
+            sort_key=gsi_sk_created_at,
+            projection_type=dynamodb.ProjectionType.INCLUDE,
+            non_key_attributes=list(_GSI_PROJECTED_ATTRIBUTES)
+        )
+
+        # Add GSI for listing all todos by creation date
+        self.todo_table.add_global_secondary_index(
+            index_name="CreatedAtIndex",
+            partition_key=gsi_pk_entity_type,
+            sort_key=gsi_sk_created_at,
+            projection_type=dynamodb.ProjectionType.INCLUDE,
+            non_key_attributes=list(_CREATED_AT_INDEX_ATTRIBUTES)
+        )
 
         # Create IAM role for Lambda functions to access DynamoDB
         self.lambda_dynamodb_role = iam.Role(
             self, "LambdaDynamoDBRole",
-            role_name=f"flask-todo-lambda-dynamodb-role-{environment}",
+            role_name=lambda_role_name_for(environment),
             assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
             managed_policies=[
                 iam.ManagedPolicy.from_aws_managed_policy_name(
@@ -105,67 +175,25 @@ class DatabaseStack(Stack):
             ]
         )
 
-        # Create custom policy for DynamoDB operations
-        dynamodb_policy = iam.Policy(
-            self, "DynamoDBAccessPolicy",
-            policy_name=f"flask-todo-dynamodb-policy-{environment}",
-            statements=[
-                iam.PolicyStatement(
-                    effect=iam.Effect.ALLOW,
-                    actions=[
-                        "dynamodb:GetItem",
-                        "dynamodb:PutItem",
-                        "dynamodb:UpdateItem",
-                        "dynamodb:DeleteItem",
-                        "dynamodb:Query",
-                        "dynamodb:Scan"
-                    ],
-                    resources=[
-                        self.todo_table.table_arn,
-                        f"{self.todo_table.table_arn}/index/*"
-                    ]
-                )
-            ]
-        )
+        # Grant the role read/write access to the table and its indexes
+        self.todo_table.grant_read_write_data(self.lambda_dynamodb_role)
 
-        # Attach policy to role
-        self.lambda_dynamodb_role.attach_inline_policy(dynamodb_policy)
-
-        # Add tags for resource management
-        Tags.of(self.todo_table).add("Project", "flask-todo-cdk")
-        Tags.of(self.todo_table).add("Environment", environment)
-        Tags.of(self.todo_table).add("Component", "database")
-        Tags.of(self.lambda_dynamodb_role).add("Project", "flask-todo-cdk")
-        Tags.of(self.lambda_dynamodb_role).add("Environment", environment)
-        Tags.of(self.lambda_dynamodb_role).add("Component", "iam")
-
-        # Export table information as stack outputs
-        CfnOutput(
-            self, "TodoTableName",
-            value=self.todo_table.table_name,
-            description="Name of the DynamoDB table for todos",
-            export_name=f"flask-todo-table-name-{environment}"
-        )
-
-        CfnOutput(
-            self, "TodoTableArn",
-            value=self.todo_table.table_arn,
-            description="ARN of the DynamoDB table for todos",
-            export_name=f"flask-todo-table-arn-{environment}"
-        )
-
-        CfnOutput(
-            self, "LambdaDynamoDBRoleArn",
-            value=self.lambda_dynamodb_role.role_arn,
-            description="ARN of the IAM role for Lambda DynamoDB access",
-            export_name=f"flask-todo-lambda-role-arn-{environment}"
-        )
+        # Add tags for resource management; tags propagate from the stack
+        # to the table and role
+        Tags.of(self).add("Project", PROJECT_TAG)
+        Tags.of(self).add("Environment", environment)
+        Tags.of(self).add("Component", "database")
 
+        # Export table information as a single stack output
         CfnOutput(
-            self, "StatusDateIndexName",
-            value="StatusDateIndex",
-            description="Name of the GSI for querying by status and date",
-            export_name=f"flask-todo-gsi-name-{environment}"
+            self, "DatabaseInfo",
+            value=Fn.to_json_string({
+                "tableName": self.todo_table.table_name,
+                "tableArn": self.todo_table.table_arn,
+                "roleArn": self.lambda_dynamodb_role.role_arn,
+                "gsi": "StatusDateIndex"
+            }),
+            description="JSON document with the todo table name/ARN, Lambda role ARN and GSI name"
         )
 
     @property
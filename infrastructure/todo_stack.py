@@ -5,13 +5,17 @@ This stack contains all the infrastructure components for the serverless
 Flask todo application including Lambda functions, API Gateway, and DynamoDB.
 """
 
+from typing import Optional
+
 from aws_cdk import (
     Stack,
     CfnOutput,
-    Tags,
 )
 from constructs import Construct
-from .database_stack import DatabaseStack
+from .database_stack import (
+    PROJECT_TAG, DatabaseStack, lambda_role_name_for, resolve_environment,
+    table_name_for
+)
 
 
 class TodoStack(Stack):
@@ -24,22 +28,51 @@ class TodoStack(Stack):
     - API Gateway for REST API (Issue #4) - TODO
     """
 
-    def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
+    def __init__(
+        self,
+        scope: Construct,
+        construct_id: str,
+        *,
+        is_prod: Optional[bool] = None,
+        **kwargs
+    ) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
-        # Get environment from context or default to 'dev'
-        environment = self.node.try_get_context("environment") or "dev"
+        # Resolve the environment once; an explicit is_prod must agree with
+        # the environment context. The result is passed down so nested
+        # components agree on it.
+        environment = resolve_environment(self, is_prod)
+        is_prod = environment == "prod"
 
-        # Create database stack
-        self.database_stack = DatabaseStack(
-            scope, f"DatabaseStack-{environment}",
-            **kwargs
+        # All stack tags are set here. Stack tags go into the cloud assembly
+        # manifest and CloudFormation propagates them to every resource at
+        # deploy time, so no tag aspect walks the construct tree.
+        self.tags.set_tag("Project", PROJECT_TAG)
+        self.tags.set_tag("Environment", environment)
+        self.tags.set_tag("ManagedBy", "CDK")
+
+        # Table details are resolved from the fixed physical names used by
+        # DatabaseStack rather than from construct references, so resources
+        # added to this stack do not require extra nested stack outputs.
+        self._table_name = table_name_for(environment)
+        self._table_arn = self.format_arn(
+            service="dynamodb",
+            resource="table",
+            resource_name=self._table_name
+        )
+        self._lambda_role_arn = self.format_arn(
+            service="iam",
+            region="",
+            resource="role",
+            resource_name=lambda_role_name_for(environment)
         )
 
-        # Add stack-level tags
-        Tags.of(self).add("Project", "FlaskTodoCDK")
-        Tags.of(self).add("Environment", environment)
-        Tags.of(self).add("ManagedBy", "CDK")
+        # Create the database as a nested stack, deployed together with this
+        # stack in a single CloudFormation operation
+        self.database_stack = DatabaseStack(
+            self, "Database",
+            is_prod=is_prod
+        )
 
         # Future components will be added here
         # TODO: Issue #3 - Add Lambda function with DynamoDB integration
@@ -60,21 +93,21 @@ class TodoStack(Stack):
         CfnOutput(
             self,
             "DatabaseStackReference",
-            value=f"DatabaseStack-{environment}",
+            value=self.database_stack.stack_name,
             description="Reference to the database stack for cross-stack integration"
         )
 
     @property
     def todo_table_name(self) -> str:
         """Return the DynamoDB table name for Lambda integration."""
-        return self.database_stack.table_name
+        return self._table_name
 
     @property
     def todo_table_arn(self) -> str:
         """Return the DynamoDB table ARN for Lambda integration."""
-        return self.database_stack.table_arn
+        return self._table_arn
 
     @property
     def lambda_role_arn(self) -> str:
         """Return the Lambda role ARN for function creation."""
-        return self.database_stack.lambda_role_arn
\ No newline at end of file
+        return self._lambda_role_arn
\ No newline at end of file
@@ -6,33 +6,236 @@ Designed to run on AWS Lambda with proper error handling and CORS support.
 """
 
 from flask import Flask, request, jsonify
-from flask_cors import CORS
+from flask.json.provider import JSONProvider
+from werkzeug.exceptions import HTTPException
 import boto3
-import json
-import uuid
+import orjson
+import base64
+import secrets
 from datetime import datetime
+from decimal import Decimal
 import os
 import logging
+import threading
+import time
+from collections import OrderedDict
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging. The Lambda runtime installs its own root handler, so
+# only this module's level is set; messages use lazy %-formatting so
+# filtered records are never rendered.
 logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+
+
+# orjson only serializes integers that fit in 64 bits
+_INT_MIN = -(2 ** 63)
+_INT_MAX = 2 ** 64 - 1
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively"""
+    if isinstance(obj, Decimal):
+        # DynamoDB returns all numbers as Decimal, with up to 38 digits
+        if obj != obj.to_integral_value():
+            return float(obj)
+        value = int(obj)
+        # Larger integers are returned as strings, as Flask's default
+        # provider does, rather than losing precision as floats
+        return value if _INT_MIN <= value <= _INT_MAX else str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_json(obj: Any) -> bytes:
+    """Serialize obj to JSON bytes with orjson"""
+    return orjson.dumps(obj, default=_json_default)
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return dump_json(obj).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        # Build the body as bytes directly, skipping the str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            dump_json(obj),
+            mimetype='application/json'
+        )
+
 
 # Initialize Flask app
 app = Flask(__name__)
-CORS(app)  # Enable CORS for all routes
+app.json = OrjsonProvider(app)
+
+# CORS policy shared by every route, so the headers are built once instead of
+# being resolved per request
+CORS_HEADERS = {'Access-Control-Allow-Origin': '*'}
+CORS_PREFLIGHT_HEADERS = {
+    **CORS_HEADERS,
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization',
+    'Access-Control-Max-Age': '600'
+}
+
+
+@app.after_request
+def add_cors_headers(response):
+    """Add CORS headers to every response, including preflight requests"""
+    if request.method == 'OPTIONS':
+        response.headers.update(CORS_PREFLIGHT_HEADERS)
+    else:
+        response.headers.update(CORS_HEADERS)
+    return response
+
+
+def create_data_resource(dynamodb_resource):
+    """
+    Create the resource used for item reads and writes
+
+    When DAX_ENDPOINT is set, item operations are routed through the DAX
+    cluster cache; otherwise the plain DynamoDB resource is used.
 
-# DynamoDB configuration
-dynamodb = boto3.resource('dynamodb')
+    Args:
+        dynamodb_resource: boto3 DynamoDB resource to fall back to
+
+    Returns:
+        DAX or DynamoDB resource exposing the same Table API
+    """
+    dax_endpoint = os.environ.get('DAX_ENDPOINT')
+    if not dax_endpoint:
+        return dynamodb_resource
+
+    # Imported lazily so the DAX client is only required when DAX is enabled
+    from amazondax import AmazonDaxClient
+    logger.info("Routing item operations through DAX: %s", dax_endpoint)
+    return AmazonDaxClient.resource(endpoint_url=dax_endpoint)
+
+
+# DynamoDB configuration. The session and resource are created once at
+# import so warm Lambda invocations reuse the resolved credentials, endpoint
+# and pooled HTTPS connections instead of rebuilding them per request.
+boto_config = Config(
+    max_pool_connections=50,
+    connect_timeout=5,
+    read_timeout=10,
+    retries={'mode': 'adaptive', 'total_max_attempts': 3},
+    tcp_keepalive=True
+)
+session = boto3.session.Session()
+dynamodb = session.resource('dynamodb', config=boto_config)
 table_name = os.environ.get('TODO_TABLE_NAME', 'flask-todo-dev')
-table = dynamodb.Table(table_name)
+data_resource = create_data_resource(dynamodb)
+table = data_resource.Table(table_name)
+# DAX does not support table operations such as DescribeTable, so keep a
+# DynamoDB handle for the health check when item operations go through DAX
+control_table = None if data_resource is dynamodb else dynamodb.Table(table_name)
 
 # Constants
-VALID_STATUSES = ['pending', 'completed', 'archived']
+# Ordered for the user-facing error message; the frozenset is for lookups
+STATUS_CHOICES = ('pending', 'completed', 'archived')
+VALID_STATUSES = frozenset(STATUS_CHOICES)
+INVALID_STATUS_MESSAGE = f"Status must be one of: {', '.join(STATUS_CHOICES)}"
 MAX_TITLE_LENGTH = 200
 MAX_DESCRIPTION_LENGTH = 1000
+# Constant partition key of CreatedAtIndex, stored on every todo item
+TODO_ENTITY_TYPE = 'todo'
+# Key attributes of the table and its indexes, the only ones that can appear
+# in a LastEvaluatedKey
+NEXT_TOKEN_KEYS = frozenset(('todo_id', 'status', 'entity_type', 'created_at'))
+DEFAULT_LIST_LIMIT = 50
+MAX_LIST_LIMIT = 100
+MAX_BATCH_SIZE = 100
+
+# Update expression for the fields a PUT replaces, built once at import.
+# Every attribute is aliased since several (e.g. status, description) are
+# DynamoDB reserved words. entity_type is set on every update so items written
+# before CreatedAtIndex existed are backfilled into it.
+UPDATE_FIELDS = ('title', 'description', 'status', 'updated_at', 'entity_type')
+UPDATE_EXPRESSION = 'SET ' + ', '.join(f'#{name} = :{name}' for name in UPDATE_FIELDS)
+UPDATE_ATTRIBUTE_NAMES = {f'#{name}': name for name in UPDATE_FIELDS}
+READ_CACHE_TTL = float(os.environ.get('READ_CACHE_TTL', '5'))
+READ_CACHE_MAX_SIZE = 1024
+HEALTH_CHECK_TTL = float(os.environ.get('HEALTH_CHECK_TTL', '30'))
+HEALTH_CHECK_FAILURE_TTL = 5
+
+
+class TTLCache:
+    """
+    Small in-process LRU cache whose entries expire after a fixed TTL
+
+    A lock guards every operation so the cache is also safe under the
+    threaded development server; on Lambda it is never contended.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry"""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Drop the entry for key if present"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Module-level so cached reads survive across warm Lambda invocations.
+# Keyed on the fully-bound query: todo_id for single items and
+# (status_filter, limit, next_token) for listings. Values are the serialized
+# response bodies, so cache hits skip JSON encoding entirely.
+item_cache = TTLCache(READ_CACHE_MAX_SIZE, READ_CACHE_TTL)
+list_cache = TTLCache(READ_CACHE_MAX_SIZE, READ_CACHE_TTL)
+
+
+# Table status rarely changes and DescribeTable is rate limited, so the
+# health probe result is shared across requests for HEALTH_CHECK_TTL seconds
+health_cache = TTLCache(1, HEALTH_CHECK_TTL)
+# Failures are remembered briefly too, so a struggling table is not probed
+# on every poll while still recovering quickly once it is healthy again
+health_failure_cache = TTLCache(1, HEALTH_CHECK_FAILURE_TTL)
+
+
+def invalidate_read_cache(todo_id: Optional[str] = None) -> None:
+    """Invalidate cached reads after a write"""
+    if todo_id is not None:
+        item_cache.pop(todo_id)
+    list_cache.clear()
 
 
 class TodoValidationError(Exception):
@@ -40,15 +243,16 @@ class TodoValidationError(Exception):
     pass
 
 
-def validate_todo_data(data: Dict) -> Dict:
+def validate_todo_data(data: Dict) -> Tuple[str, str, str]:
     """
-    Validate todo data for creation/update operations
+    Validate todo data for creation/update operations and return its
+    cleaned fields
     
     Args:
         data: Dictionary containing todo data
         
     Returns:
-        Validated and cleaned todo data
+        Tuple of (title, description, status)
         
     Raises:
         TodoValidationError: If validation fails
@@ -57,43 +261,157 @@ def validate_todo_data(data: Dict) -> Dict:
         raise TodoValidationError("Request body must be a JSON object")
     
     # Validate title
-    title = data.get('title', '').strip()
+    title = data.get('title', '')
+    if not isinstance(title, str):
+        raise TodoValidationError("Title must be a string")
+    title = title.strip()
     if not title:
         raise TodoValidationError("Title is required")
     if len(title) > MAX_TITLE_LENGTH:
         raise TodoValidationError(f"Title must be {MAX_TITLE_LENGTH} characters or less")
     
     # Validate description (optional)
-    description = data.get('description', '').strip()
+    description = data.get('description', '')
+    if not isinstance(description, str):
+        raise TodoValidationError("Description must be a string")
+    description = description.strip()
     if len(description) > MAX_DESCRIPTION_LENGTH:
         raise TodoValidationError(f"Description must be {MAX_DESCRIPTION_LENGTH} characters or less")
     
     # Validate status
-    status = data.get('status', 'pending').lower()
-    if status not in VALID_STATUSES:
-        raise TodoValidationError(f"Status must be one of: {', '.join(VALID_STATUSES)}")
+    status = data.get('status', 'pending')
+    if not isinstance(status, str) or status.lower() not in VALID_STATUSES:
+        raise TodoValidationError(INVALID_STATUS_MESSAGE)
     
-    return {
-        'title': title,
-        'description': description,
-        'status': status
-    }
+    return title, description, status.lower()
+
+
+def parse_json_body() -> Any:
+    """
+    Decode the request body with orjson
+    
+    Raises:
+        TodoValidationError: If the body is not valid JSON
+    """
+    try:
+        return orjson.loads(request.get_data(cache=False) or b'{}')
+    except orjson.JSONDecodeError:
+        raise TodoValidationError("Request body must be valid JSON")
+
+
+# Static error bodies, serialized once at import
+ERROR_TODO_NOT_FOUND = orjson.dumps({'error': 'Todo not found'})
+ERROR_CONTENT_TYPE = orjson.dumps({'error': 'Content-Type must be application/json'})
+ERROR_ENDPOINT_NOT_FOUND = orjson.dumps({'error': 'Endpoint not found'})
+ERROR_METHOD_NOT_ALLOWED = orjson.dumps({'error': 'Method not allowed'})
+
 
+def static_response(body: bytes, status: int):
+    """Return a JSON response for a pre-serialized body"""
+    return app.response_class(body, status=status, mimetype='application/json')
 
-def create_todo_item(todo_id: str, validated_data: Dict) -> Dict:
-    """Create a new todo item with timestamps"""
-    now = datetime.utcnow().isoformat() + 'Z'
+
+# Treat naive datetimes as UTC and emit a "Z" suffix
+_ISO_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def iso_now() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string
+
+    Microseconds are always included so timestamps have a fixed width and
+    sort correctly as strings in the created_at index.
+    """
+    now = datetime.utcnow()
+    # orjson formats datetimes natively, but omits a zero fractional part
+    timestamp = orjson.dumps(now, option=_ISO_OPTIONS)[1:-1].decode()
+    return timestamp if now.microsecond else timestamp[:-1] + '.000000Z'
+
+
+def generate_todo_id() -> str:
+    """Return a new random 128-bit todo ID as 32 hex characters"""
+    return secrets.token_hex(16)
+
+
+def build_new_item(data: Dict, todo_id: Optional[str] = None,
+                   now: Optional[str] = None) -> Dict:
+    """
+    Validate todo data and build the new item in a single pass
     
+    Args:
+        data: Dictionary containing todo data
+        todo_id: ID for the item; generated if not given
+        now: Creation timestamp; the current time if not given
+        
+    Returns:
+        Todo item ready to be written to DynamoDB
+        
+    Raises:
+        TodoValidationError: If validation fails
+    """
+    title, description, status = validate_todo_data(data)
+    now = now or iso_now()
     return {
-        'todo_id': todo_id,
-        'title': validated_data['title'],
-        'description': validated_data['description'],
-        'status': validated_data['status'],
+        'todo_id': todo_id or generate_todo_id(),
+        'entity_type': TODO_ENTITY_TYPE,
+        'title': title,
+        'description': description,
+        'status': status,
         'created_at': now,
         'updated_at': now
     }
 
 
+def to_api_item(item: Dict) -> Dict:
+    """Return a stored todo item without internal attributes such as entity_type"""
+    if 'entity_type' not in item:
+        return item
+    return {key: value for key, value in item.items() if key != 'entity_type'}
+
+
+def parse_limit(raw_limit: str) -> int:
+    """
+    Parse the list page size, clamped to 1..MAX_LIST_LIMIT
+
+    Non-numeric values fall back to the default page size.
+    """
+    # Digit check up front avoids raising ValueError for non-numeric input
+    if raw_limit.isascii() and raw_limit.isdigit():
+        return min(max(int(raw_limit), 1), MAX_LIST_LIMIT)
+    return DEFAULT_LIST_LIMIT
+
+
+def encode_next_token(last_evaluated_key: Optional[Dict]) -> Optional[str]:
+    """Encode a DynamoDB LastEvaluatedKey as an opaque pagination token"""
+    if not last_evaluated_key:
+        return None
+    return base64.urlsafe_b64encode(orjson.dumps(last_evaluated_key)).decode()
+
+
+def decode_next_token(next_token: Optional[str]) -> Optional[Dict]:
+    """
+    Decode a pagination token back into an ExclusiveStartKey
+    
+    Raises:
+        ValueError: If the token is malformed
+    """
+    if not next_token:
+        return None
+    try:
+        start_key = orjson.loads(base64.urlsafe_b64decode(next_token.encode()))
+    except Exception as e:
+        raise ValueError("Invalid next_token") from e
+    # The token comes from the client, so only accept the string key
+    # attributes a LastEvaluatedKey from the table or its indexes can hold
+    if not (
+        isinstance(start_key, dict)
+        and start_key.keys() <= NEXT_TOKEN_KEYS
+        and all(isinstance(value, str) for value in start_key.values())
+    ):
+        raise ValueError("Invalid next_token")
+    return start_key
+
+
 def handle_dynamodb_error(error: ClientError) -> Tuple[Dict, int]:
     """Handle DynamoDB errors and return appropriate HTTP responses"""
     error_code = error.response['Error']['Code']
@@ -103,28 +421,53 @@ def handle_dynamodb_error(error: ClientError) -> Tuple[Dict, int]:
     elif error_code == 'ValidationException':
         return {'error': 'Invalid request data'}, 400
     elif error_code == 'ConditionalCheckFailedException':
-        return {'error': 'Item not found or condition failed'}, 404
+        # Raised by the attribute_exists(todo_id) guard on updates and deletes
+        return {'error': 'Todo not found'}, 404
     else:
-        logger.error(f"DynamoDB error: {error}")
+        logger.error("DynamoDB error: %s", error)
         return {'error': 'Database operation failed'}, 500
 
 
+def get_table_status() -> str:
+    """Return the table status, issuing DescribeTable at most once per TTL"""
+    status = health_cache.get('table_status')
+    if status is not None:
+        return status
+    
+    # Only the message is cached, so each request raises its own exception
+    # rather than re-raising (and mutating) one shared instance
+    message = health_failure_cache.get('error')
+    if message is not None:
+        raise RuntimeError(message)
+    
+    probe_table = control_table or table
+    try:
+        # The resource caches its first load, so reload to get fresh status
+        probe_table.reload()
+        status = probe_table.table_status
+    except Exception as e:
+        health_failure_cache.set('error', str(e))
+        raise
+    health_cache.set('table_status', status)
+    return status
+
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
     try:
         # Test DynamoDB connection
-        table.table_status
+        get_table_status()
         return jsonify({
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat() + 'Z',
+            "timestamp": iso_now(),
             "table": table_name
         })
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         return jsonify({
             "status": "unhealthy",
-            "timestamp": datetime.utcnow().isoformat() + 'Z',
+            "timestamp": iso_now(),
             "error": str(e)
         }), 503
 
@@ -132,204 +475,242 @@ def health_check():
 @app.route('/todos', methods=['GET'])
 def list_todos():
     """List all todos with optional status filtering"""
+    # Get query parameters
+    status_filter = request.args.get('status', '').lower()
+    limit = parse_limit(request.args.get('limit', ''))
+    
+    if status_filter not in VALID_STATUSES:
+        status_filter = ''
+    
+    next_token = request.args.get('next_token') or None
     try:
-        # Get query parameters
-        status_filter = request.args.get('status', '').lower()
-        limit = request.args.get('limit', '50')
-        
-        # Validate limit
-        try:
-            limit = int(limit)
-            if limit < 1 or limit > 100:
-                limit = 50
-        except ValueError:
-            limit = 50
-        
-        # Query todos
-        if status_filter and status_filter in VALID_STATUSES:
-            # Use GSI to filter by status
-            response = table.query(
-                IndexName='StatusDateIndex',
-                KeyConditionExpression='#status = :status',
-                ExpressionAttributeNames={'#status': 'status'},
-                ExpressionAttributeValues={':status': status_filter},
-                Limit=limit,
-                ScanIndexForward=False  # Sort by created_at descending
-            )
-        else:
-            # Scan all items
-            response = table.scan(Limit=limit)
-        
-        todos = response.get('Items', [])
-        
-        # Sort by created_at descending if not using GSI
-        if not status_filter or status_filter not in VALID_STATUSES:
-            todos.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-        
-        return jsonify({
-            'todos': todos,
-            'count': len(todos),
-            'status_filter': status_filter if status_filter in VALID_STATUSES else None
-        })
-        
-    except ClientError as e:
-        error_response, status_code = handle_dynamodb_error(e)
-        return jsonify(error_response), status_code
-    except Exception as e:
-        logger.error(f"Error listing todos: {e}")
-        return jsonify({'error': 'Failed to retrieve todos'}), 500
+        start_key = decode_next_token(next_token)
+    except ValueError:
+        return jsonify({'error': 'Invalid next_token'}), 400
+    
+    cache_key = (status_filter, limit, next_token)
+    body = list_cache.get(cache_key)
+    if body is not None:
+        return static_response(body, 200)
+    
+    # Both indexes are sorted by created_at, so pages come back newest
+    # first without a Scan or client-side sort
+    if status_filter:
+        # Use GSI to filter by status
+        query_kwargs = {
+            'IndexName': 'StatusDateIndex',
+            'KeyConditionExpression': '#pk = :pk',
+            'ExpressionAttributeNames': {'#pk': 'status'},
+            'ExpressionAttributeValues': {':pk': status_filter}
+        }
+    else:
+        query_kwargs = {
+            'IndexName': 'CreatedAtIndex',
+            'KeyConditionExpression': '#pk = :pk',
+            'ExpressionAttributeNames': {'#pk': 'entity_type'},
+            'ExpressionAttributeValues': {':pk': TODO_ENTITY_TYPE}
+        }
+    if start_key:
+        query_kwargs['ExclusiveStartKey'] = start_key
+    
+    response = table.query(
+        Limit=limit,
+        ScanIndexForward=False,  # Sort by created_at descending
+        **query_kwargs
+    )
+    
+    todos = [to_api_item(item) for item in response.get('Items', [])]
+    result = {
+        'todos': todos,
+        'count': len(todos),
+        'status_filter': status_filter or None,
+        'next_token': encode_next_token(response.get('LastEvaluatedKey'))
+    }
+    body = dump_json(result)
+    list_cache.set(cache_key, body)
+    
+    return static_response(body, 200)
 
 
 @app.route('/todos/<todo_id>', methods=['GET'])
 def get_todo(todo_id: str):
     """Get a specific todo by ID"""
-    try:
-        response = table.get_item(Key={'todo_id': todo_id})
-        
-        if 'Item' not in response:
-            return jsonify({'error': 'Todo not found'}), 404
-        
-        return jsonify(response['Item'])
-        
-    except ClientError as e:
-        error_response, status_code = handle_dynamodb_error(e)
-        return jsonify(error_response), status_code
-    except Exception as e:
-        logger.error(f"Error getting todo {todo_id}: {e}")
-        return jsonify({'error': 'Failed to retrieve todo'}), 500
+    body = item_cache.get(todo_id)
+    if body is not None:
+        return static_response(body, 200)
+    
+    response = table.get_item(Key={'todo_id': todo_id})
+    
+    if 'Item' not in response:
+        return static_response(ERROR_TODO_NOT_FOUND, 404)
+    
+    body = dump_json(to_api_item(response['Item']))
+    item_cache.set(todo_id, body)
+    return static_response(body, 200)
 
 
 @app.route('/todos', methods=['POST'])
 def create_todo():
     """Create a new todo"""
+    # Validate request data
+    if not request.is_json:
+        return static_response(ERROR_CONTENT_TYPE, 400)
+    
+    data = parse_json_body()
+    todo_item = build_new_item(data)
+    todo_id = todo_item['todo_id']
+    
+    # Save to DynamoDB
+    table.put_item(Item=todo_item)
+    invalidate_read_cache()
+    
+    logger.info("Created todo: %s", todo_id)
+    return jsonify(to_api_item(todo_item)), 201
+
+
+@app.route('/todos/batch', methods=['POST'])
+def create_todos_batch():
+    """Create multiple todos from a JSON array in one request"""
+    # Validate request data
+    if not request.is_json:
+        return static_response(ERROR_CONTENT_TYPE, 400)
+    
+    data = parse_json_body()
+    if not isinstance(data, list) or not data:
+        return jsonify({'error': 'Request body must be a non-empty JSON array'}), 400
+    if len(data) > MAX_BATCH_SIZE:
+        return jsonify({'error': f'Batch must contain {MAX_BATCH_SIZE} todos or less'}), 400
+    
+    # Validate every item before writing any of them
+    now = iso_now()
+    todo_items = []
+    for index, item_data in enumerate(data):
+        try:
+            todo_items.append(build_new_item(item_data, now=now))
+        except TodoValidationError as e:
+            return jsonify({'error': f'Item {index}: {e}'}), 400
+    
+    # batch_writer sends BatchWriteItem requests of up to 25 items and
+    # resubmits any UnprocessedItems; throttling errors are retried with
+    # backoff by the client's adaptive retry mode. A failed flush can leave
+    # earlier chunks written, so cached listings are dropped either way.
     try:
-        # Validate request data
-        if not request.is_json:
-            return jsonify({'error': 'Content-Type must be application/json'}), 400
-        
-        data = request.get_json()
-        validated_data = validate_todo_data(data)
-        
-        # Create todo item
-        todo_id = str(uuid.uuid4())
-        todo_item = create_todo_item(todo_id, validated_data)
-        
-        # Save to DynamoDB
-        table.put_item(Item=todo_item)
-        
-        logger.info(f"Created todo: {todo_id}")
-        return jsonify(todo_item), 201
-        
-    except TodoValidationError as e:
-        return jsonify({'error': str(e)}), 400
-    except ClientError as e:
-        error_response, status_code = handle_dynamodb_error(e)
-        return jsonify(error_response), status_code
-    except Exception as e:
-        logger.error(f"Error creating todo: {e}")
-        return jsonify({'error': 'Failed to create todo'}), 500
+        with table.batch_writer(overwrite_by_pkeys=['todo_id']) as batch:
+            for todo_item in todo_items:
+                batch.put_item(Item=todo_item)
+    finally:
+        invalidate_read_cache()
+    
+    logger.info("Created %s todos in batch", len(todo_items))
+    todos = [to_api_item(todo_item) for todo_item in todo_items]
+    return jsonify({'todos': todos, 'count': len(todos)}), 201
 
 
 @app.route('/todos/<todo_id>', methods=['PUT'])
 def update_todo(todo_id: str):
     """Update an existing todo"""
-    try:
-        # Validate request data
-        if not request.is_json:
-            return jsonify({'error': 'Content-Type must be application/json'}), 400
-        
-        data = request.get_json()
-        validated_data = validate_todo_data(data)
-        
-        # Check if todo exists
-        existing_response = table.get_item(Key={'todo_id': todo_id})
-        if 'Item' not in existing_response:
-            return jsonify({'error': 'Todo not found'}), 404
-        
-        existing_todo = existing_response['Item']
-        
-        # Update todo item
-        updated_todo = {
-            'todo_id': todo_id,
-            'title': validated_data['title'],
-            'description': validated_data['description'],
-            'status': validated_data['status'],
-            'created_at': existing_todo['created_at'],
-            'updated_at': datetime.utcnow().isoformat() + 'Z'
-        }
-        
-        # Save to DynamoDB
-        table.put_item(Item=updated_todo)
-        
-        logger.info(f"Updated todo: {todo_id}")
-        return jsonify(updated_todo)
-        
-    except TodoValidationError as e:
-        return jsonify({'error': str(e)}), 400
-    except ClientError as e:
-        error_response, status_code = handle_dynamodb_error(e)
-        return jsonify(error_response), status_code
-    except Exception as e:
-        logger.error(f"Error updating todo {todo_id}: {e}")
-        return jsonify({'error': 'Failed to update todo'}), 500
+    # Validate request data
+    if not request.is_json:
+        return static_response(ERROR_CONTENT_TYPE, 400)
+    
+    data = parse_json_body()
+    title, description, status = validate_todo_data(data)
+    
+    # Single conditional write instead of a read-then-write round trip
+    response = table.update_item(
+        Key={'todo_id': todo_id},
+        UpdateExpression=UPDATE_EXPRESSION,
+        ConditionExpression='attribute_exists(todo_id)',
+        ExpressionAttributeNames=UPDATE_ATTRIBUTE_NAMES,
+        ExpressionAttributeValues={
+            ':title': title,
+            ':description': description,
+            ':status': status,
+            ':updated_at': iso_now(),
+            ':entity_type': TODO_ENTITY_TYPE
+        },
+        ReturnValues='ALL_NEW'
+    )
+    updated_todo = to_api_item(response['Attributes'])
+    invalidate_read_cache(todo_id)
+    
+    logger.info("Updated todo: %s", todo_id)
+    return jsonify(updated_todo)
 
 
 @app.route('/todos/<todo_id>', methods=['DELETE'])
 def delete_todo(todo_id: str):
     """Delete a todo"""
-    try:
-        # Check if todo exists first
-        existing_response = table.get_item(Key={'todo_id': todo_id})
-        if 'Item' not in existing_response:
-            return jsonify({'error': 'Todo not found'}), 404
-        
-        # Delete the todo
-        table.delete_item(Key={'todo_id': todo_id})
-        
-        logger.info(f"Deleted todo: {todo_id}")
-        return jsonify({'message': 'Todo deleted successfully'}), 200
-        
-    except ClientError as e:
-        error_response, status_code = handle_dynamodb_error(e)
-        return jsonify(error_response), status_code
-    except Exception as e:
-        logger.error(f"Error deleting todo {todo_id}: {e}")
-        return jsonify({'error': 'Failed to delete todo'}), 500
+    # Delete the todo, failing if it does not exist
+    table.delete_item(
+        Key={'todo_id': todo_id},
+        ConditionExpression='attribute_exists(todo_id)'
+    )
+    invalidate_read_cache(todo_id)
+    
+    logger.info("Deleted todo: %s", todo_id)
+    return jsonify({'message': 'Todo deleted successfully'}), 200
 
 
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
-    return jsonify({'error': 'Endpoint not found'}), 404
+    return static_response(ERROR_ENDPOINT_NOT_FOUND, 404)
 
 
 @app.errorhandler(405)
 def method_not_allowed(error):
     """Handle 405 errors"""
-    return jsonify({'error': 'Method not allowed'}), 405
+    return static_response(ERROR_METHOD_NOT_ALLOWED, 405)
 
 
-@app.errorhandler(500)
+@app.errorhandler(TodoValidationError)
+def validation_error(error):
+    """Handle invalid request data raised by any endpoint"""
+    return jsonify({'error': str(error)}), 400
+
+
+@app.errorhandler(ClientError)
+def dynamodb_error(error):
+    """Handle DynamoDB errors raised by any endpoint"""
+    error_response, status_code = handle_dynamodb_error(error)
+    return jsonify(error_response), status_code
+
+
+@app.errorhandler(Exception)
 def internal_error(error):
-    """Handle 500 errors"""
-    logger.error(f"Internal server error: {error}")
+    """Handle unexpected errors and 500s"""
+    # Other HTTP errors (e.g. 400 from Werkzeug) keep their own responses
+    if isinstance(error, HTTPException) and error.code != 500:
+        return error
+    logger.error("Error handling %s %s: %s", request.method, request.path, error)
     return jsonify({'error': 'Internal server error'}), 500
 
 
-# Lambda handler for AWS Lambda deployment
+# Lambda handler for AWS Lambda deployment. The apig_wsgi adapter is built on
+# the first invocation and reused by every warm invocation after it.
+_wsgi_handler = None
+
+
 def lambda_handler(event, context):
     """AWS Lambda handler function"""
-    try:
-        from serverless_wsgi import handle_request
-        return handle_request(app, event, context)
-    except ImportError:
-        # Fallback for local development
-        return {
-            'statusCode': 500,
-            'body': json.dumps({'error': 'serverless_wsgi not available'})
-        }
+    global _wsgi_handler
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", orjson.dumps(event, default=str).decode())
+    if _wsgi_handler is None:
+        try:
+            from apig_wsgi import make_lambda_handler
+        except ImportError:
+            # Fallback for local development
+            return {
+                'statusCode': 500,
+                'body': orjson.dumps({'error': 'apig_wsgi not available'}).decode()
+            }
+        _wsgi_handler = make_lambda_handler(app, binary_support=True)
+    return _wsgi_handler(event, context)
 
 
 if __name__ == '__main__':
     # For local development
+    logging.basicConfig(level=logging.INFO)
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
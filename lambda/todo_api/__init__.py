@@ -1,6 +0,0 @@
-"""
-Flask Todo API package.
-
-This package will contain the Flask application code for the todo API.
-Implementation will be added in Issue #3.
-"""
\ No newline at end of file
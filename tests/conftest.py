@@ -0,0 +1,71 @@
+"""
+Shared pytest fixtures
+
+Fixtures here are session-scoped so that the Flask test client, sample
+data and IDs are built once for the whole test run.
+"""
+
+import os
+import sys
+import uuid
+from types import MappingProxyType
+
+import pytest
+
+# todo_api builds its boto3 resource at import, which needs a region. The
+# tests never reach AWS, so any region will do when none is configured.
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+# Add lambda directory to path for imports. It is appended rather than
+# prepended since nothing in it shadows an installed module, so unrelated
+# imports do not search it first.
+LAMBDA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'lambda'))
+if LAMBDA_DIR not in sys.path:
+    sys.path.append(LAMBDA_DIR)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create test client"""
+    from todo_api import app
+
+    app.testing = True
+    app.config['PROPAGATE_EXCEPTIONS'] = False
+    # No endpoint sets cookies, so skip the cookie jar on every request
+    with app.test_client(use_cookies=False) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def sample_todo():
+    """Sample todo data for testing; read-only since it is shared"""
+    return MappingProxyType({
+        'title': 'Test Todo',
+        'description': 'This is a test todo item',
+        'status': 'pending'
+    })
+
+
+@pytest.fixture(scope="session")
+def sample_todos():
+    """Stored todos as returned by a list query; read-only since they are shared"""
+    return (
+        MappingProxyType({
+            'todo_id': '1',
+            'title': 'Todo 1',
+            'status': 'pending',
+            'created_at': '2023-01-01T00:00:00Z'
+        }),
+        MappingProxyType({
+            'todo_id': '2',
+            'title': 'Todo 2',
+            'status': 'completed',
+            'created_at': '2023-01-02T00:00:00Z'
+        })
+    )
+
+
+@pytest.fixture(scope="session")
+def todo_id():
+    """Fixed todo ID; tests clear the read caches so it need not be unique"""
+    return str(uuid.UUID(int=1))
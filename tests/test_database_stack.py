@@ -14,14 +14,16 @@ from infrastructure.database_stack import DatabaseStack
 class TestDatabaseStack:
     """Test suite for DatabaseStack"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.app = cdk.App()
-        self.stack = DatabaseStack(
-            self.app, "TestDatabaseStack",
+    @classmethod
+    def setup_class(cls):
+        """Synthesize the stack once; the tests only read the template"""
+        cls.app = cdk.App()
+        cls.parent = cdk.Stack(
+            cls.app, "TestParentStack",
             env=cdk.Environment(region="us-east-1")
         )
-        self.template = assertions.Template.from_stack(self.stack)
+        cls.stack = DatabaseStack(cls.parent, "TestDatabaseStack")
+        cls.template = assertions.Template.from_stack(cls.stack)
 
     def test_dynamodb_table_created(self):
         """Test that DynamoDB table is created with correct configuration"""
@@ -46,12 +48,16 @@ class TestDatabaseStack:
                 {
                     "AttributeName": "created_at",
                     "AttributeType": "S"
+                },
+                {
+                    "AttributeName": "entity_type",
+                    "AttributeType": "S"
                 }
             ]
         })
 
     def test_global_secondary_index_created(self):
-        """Test that GSI is created with correct configuration"""
+        """Test that the GSIs are created with correct configuration"""
         self.template.has_resource_properties("AWS::DynamoDB::Table", {
             "GlobalSecondaryIndexes": [
                 {
@@ -67,7 +73,25 @@ class TestDatabaseStack:
                         }
                     ],
                     "Projection": {
-                        "ProjectionType": "ALL"
+                        "ProjectionType": "INCLUDE",
+                        "NonKeyAttributes": ["title", "description", "updated_at"]
+                    }
+                },
+                {
+                    "IndexName": "CreatedAtIndex",
+                    "KeySchema": [
+                        {
+                            "AttributeName": "entity_type",
+                            "KeyType": "HASH"
+                        },
+                        {
+                            "AttributeName": "created_at",
+                            "KeyType": "RANGE"
+                        }
+                    ],
+                    "Projection": {
+                        "ProjectionType": "INCLUDE",
+                        "NonKeyAttributes": ["title", "description", "updated_at", "status"]
                     }
                 }
             ]
@@ -99,59 +123,46 @@ class TestDatabaseStack:
         })
 
     def test_dynamodb_policy_created(self):
-        """Test that DynamoDB access policy is created with correct permissions"""
+        """Test that the Lambda role is granted read/write access to the table"""
         self.template.has_resource_properties("AWS::IAM::Policy", {
-            "PolicyName": "flask-todo-dynamodb-policy-dev",
             "PolicyDocument": {
-                "Statement": [
-                    {
-                        "Action": [
+                "Statement": assertions.Match.array_with([
+                    assertions.Match.object_like({
+                        "Action": assertions.Match.array_with([
+                            "dynamodb:Query",
                             "dynamodb:GetItem",
+                            "dynamodb:Scan",
                             "dynamodb:PutItem",
                             "dynamodb:UpdateItem",
-                            "dynamodb:DeleteItem",
-                            "dynamodb:Query",
-                            "dynamodb:Scan"
-                        ],
-                        "Effect": "Allow"
-                    }
-                ]
-            }
+                            "dynamodb:DeleteItem"
+                        ]),
+                        "Effect": "Allow",
+                        "Resource": assertions.Match.array_with([
+                            {
+                                "Fn::Join": [
+                                    "",
+                                    [
+                                        {"Fn::GetAtt": [assertions.Match.any_value(), "Arn"]},
+                                        "/index/*"
+                                    ]
+                                ]
+                            }
+                        ])
+                    })
+                ])
+            },
+            "Roles": [{"Ref": assertions.Match.string_like_regexp("LambdaDynamoDBRole")}]
         })
 
     def test_stack_outputs_created(self):
-        """Test that all required stack outputs are created"""
-        # Test table name output
-        self.template.has_output("TodoTableName", {
-            "Description": "Name of the DynamoDB table for todos",
-            "Export": {
-                "Name": "flask-todo-table-name-dev"
-            }
+        """Test that table details are published as a single JSON output"""
+        self.template.has_output("DatabaseInfo", {
+            "Description": "JSON document with the todo table name/ARN, Lambda role ARN and GSI name",
+            "Export": assertions.Match.absent()
         })
 
-        # Test table ARN output
-        self.template.has_output("TodoTableArn", {
-            "Description": "ARN of the DynamoDB table for todos",
-            "Export": {
-                "Name": "flask-todo-table-arn-dev"
-            }
-        })
-
-        # Test Lambda role ARN output
-        self.template.has_output("LambdaDynamoDBRoleArn", {
-            "Description": "ARN of the IAM role for Lambda DynamoDB access",
-            "Export": {
-                "Name": "flask-todo-lambda-role-arn-dev"
-            }
-        })
-
-        # Test GSI name output
-        self.template.has_output("StatusDateIndexName", {
-            "Description": "Name of the GSI for querying by status and date",
-            "Export": {
-                "Name": "flask-todo-gsi-name-dev"
-            }
-        })
+        outputs = self.template.find_outputs("*")
+        assert list(outputs) == ["DatabaseInfo"]
 
     def test_resource_tags_applied(self):
         """Test that proper tags are applied to resources"""
@@ -167,7 +178,7 @@ class TestDatabaseStack:
         # Test IAM role tags
         self.template.has_resource_properties("AWS::IAM::Role", {
             "Tags": [
-                {"Key": "Component", "Value": "iam"},
+                {"Key": "Component", "Value": "database"},
                 {"Key": "Environment", "Value": "dev"},
                 {"Key": "Project", "Value": "flask-todo-cdk"}
             ]
@@ -189,6 +200,25 @@ class TestDatabaseStack:
         self.template.resource_count_is("AWS::IAM::Role", 1)
         self.template.resource_count_is("AWS::IAM::Policy", 1)
 
+    def test_prod_configuration(self):
+        """Test that is_prod selects the production table configuration"""
+        app = cdk.App()
+        parent = cdk.Stack(app, "TestParentStack")
+        stack = DatabaseStack(parent, "TestProdDatabaseStack", is_prod=True)
+        template = assertions.Template.from_stack(stack)
+
+        template.has_resource_properties("AWS::DynamoDB::Table", {
+            "TableName": "flask-todo-prod",
+            "BillingMode": "PAY_PER_REQUEST",
+            "StreamSpecification": {
+                "StreamViewType": "NEW_IMAGE"
+            },
+            "ProvisionedThroughput": assertions.Match.absent()
+        })
+        template.has_resource("AWS::DynamoDB::Table", {
+            "DeletionPolicy": "Retain"
+        })
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
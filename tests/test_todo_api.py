@@ -5,43 +5,51 @@ Tests all API endpoints, error handling, validation, and DynamoDB integration.
 """
 
 import pytest
+import base64
+import importlib.util
 import json
-import uuid
+import sys
+import threading
+import types
 from datetime import datetime
+from decimal import Decimal
+from operator import itemgetter
 from unittest.mock import patch, MagicMock
-import sys
-import os
+from botocore.exceptions import ClientError
+
+import todo_api
+from todo_api import (
+    lambda_handler, create_data_resource, validate_todo_data, build_new_item, TodoValidationError,
+    TTLCache, item_cache, list_cache, health_cache,
+    health_failure_cache, iso_now, generate_todo_id, parse_limit
+)
+
+# Unpacks the list endpoint's body in one C-level call
+todos_and_count = itemgetter('todos', 'count')
 
-# Add lambda directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lambda'))
 
-from todo_api import app, validate_todo_data, create_todo_item, TodoValidationError
+@pytest.fixture(scope="module")
+def mock_table():
+    """Mock DynamoDB table, shared by the module and reset between tests"""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # Spec the mock from the real Table resource class so only genuine
+        # Table attributes exist and misspelled calls fail loudly
+        mock = MagicMock(spec=type(todo_api.table))
+        monkeypatch.setattr('todo_api.table', mock)
+        yield mock
 
 
 class TestTodoAPI:
     """Test suite for Flask Todo API"""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client"""
-        app.config['TESTING'] = True
-        with app.test_client() as client:
-            yield client
-
-    @pytest.fixture
-    def sample_todo(self):
-        """Sample todo data for testing"""
-        return {
-            'title': 'Test Todo',
-            'description': 'This is a test todo item',
-            'status': 'pending'
-        }
-
-    @pytest.fixture
-    def mock_table(self):
-        """Mock DynamoDB table"""
-        with patch('todo_api.table') as mock:
-            yield mock
+    @pytest.fixture(autouse=True)
+    def reset_state(self, mock_table):
+        """Clear the read caches and the shared mock table before each test"""
+        item_cache.clear()
+        list_cache.clear()
+        health_cache.clear()
+        health_failure_cache.clear()
+        mock_table.reset_mock(return_value=True, side_effect=True)
 
     def test_health_check_success(self, client, mock_table):
         """Test health check endpoint - success"""
@@ -50,122 +58,246 @@ class TestTodoAPI:
         response = client.get('/health')
         assert response.status_code == 200
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['status'] == 'healthy'
         assert 'timestamp' in data
         assert 'table' in data
 
     def test_health_check_failure(self, client, mock_table):
         """Test health check endpoint - failure"""
-        mock_table.table_status.side_effect = Exception("Connection failed")
+        mock_table.reload.side_effect = Exception("Connection failed")
         
         response = client.get('/health')
         assert response.status_code == 503
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['status'] == 'unhealthy'
 
+    def test_health_check_cached(self, client, mock_table):
+        """Test that the table status probe is reused between health checks"""
+        mock_table.table_status = 'ACTIVE'
+        
+        assert client.get('/health').status_code == 200
+        assert client.get('/health').status_code == 200
+        mock_table.reload.assert_called_once()
+
+    def test_health_check_failure_cached(self, client, mock_table):
+        """Test that a failed probe is not repeated on every health check"""
+        mock_table.reload.side_effect = Exception("Connection failed")
+        
+        assert client.get('/health').status_code == 503
+        response = client.get('/health')
+        assert response.status_code == 503
+        assert response.get_json()['error'] == 'Connection failed'
+        mock_table.reload.assert_called_once()
+
     def test_list_todos_empty(self, client, mock_table):
         """Test listing todos when table is empty"""
-        mock_table.scan.return_value = {'Items': []}
+        mock_table.query.return_value = {'Items': []}
         
         response = client.get('/todos')
         assert response.status_code == 200
         
-        data = json.loads(response.data)
-        assert data['todos'] == []
-        assert data['count'] == 0
+        data = response.get_json()
+        todos, count = todos_and_count(data)
+        assert todos == []
+        assert count == 0
 
-    def test_list_todos_with_data(self, client, mock_table):
+    def test_list_todos_with_data(self, client, mock_table, sample_todos):
         """Test listing todos with data"""
-        sample_todos = [
-            {
-                'todo_id': '1',
-                'title': 'Todo 1',
-                'status': 'pending',
-                'created_at': '2023-01-01T00:00:00Z'
-            },
-            {
-                'todo_id': '2',
-                'title': 'Todo 2',
-                'status': 'completed',
-                'created_at': '2023-01-02T00:00:00Z'
-            }
-        ]
-        mock_table.scan.return_value = {'Items': sample_todos}
+        mock_table.query.return_value = {
+            'Items': [{**todo, 'entity_type': 'todo'} for todo in sample_todos]
+        }
         
         response = client.get('/todos')
         assert response.status_code == 200
         
-        data = json.loads(response.data)
-        assert len(data['todos']) == 2
-        assert data['count'] == 2
+        data = response.get_json()
+        todos, count = todos_and_count(data)
+        assert len(todos) == 2
+        assert count == 2
+        assert all('entity_type' not in todo for todo in todos)
+        assert data['next_token'] is None
+        mock_table.scan.assert_not_called()
+        assert mock_table.query.call_args.kwargs['IndexName'] == 'CreatedAtIndex'
+
+    def test_list_todos_pagination(self, client, mock_table):
+        """Test that LastEvaluatedKey round-trips through next_token"""
+        last_key = {
+            'todo_id': '2',
+            'entity_type': 'todo',
+            'created_at': '2023-01-02T00:00:00Z'
+        }
+        mock_table.query.return_value = {'Items': [], 'LastEvaluatedKey': last_key}
+        
+        response = client.get('/todos?limit=1')
+        next_token = response.get_json()['next_token']
+        assert next_token
+        
+        client.get(f'/todos?limit=1&next_token={next_token}')
+        assert mock_table.query.call_args.kwargs['ExclusiveStartKey'] == last_key
+
+    def test_list_todos_invalid_next_token(self, client, mock_table):
+        """Test that a malformed next_token is rejected"""
+        response = client.get('/todos?next_token=not-a-token')
+        assert response.status_code == 400
 
-    def test_list_todos_with_status_filter(self, client, mock_table):
+    @pytest.mark.parametrize('start_key', [
+        {'todo_id': 1.5, 'entity_type': 'todo', 'created_at': 'x'},
+        {'todo_id': '1', 'title': 'not a key'},
+        ['todo_id', '1'],
+    ])
+    def test_list_todos_next_token_bad_key(self, client, mock_table, start_key):
+        """Test that a well-formed token with an invalid key is rejected"""
+        next_token = base64.urlsafe_b64encode(json.dumps(start_key).encode()).decode()
+        
+        response = client.get(f'/todos?next_token={next_token}')
+        assert response.status_code == 400
+        mock_table.query.assert_not_called()
+
+    def test_list_todos_with_status_filter(self, client, mock_table, sample_todos):
         """Test listing todos with status filter"""
-        sample_todos = [
-            {
-                'todo_id': '1',
-                'title': 'Completed Todo',
-                'status': 'completed',
-                'created_at': '2023-01-01T00:00:00Z'
-            }
-        ]
-        mock_table.query.return_value = {'Items': sample_todos}
+        completed = [dict(todo) for todo in sample_todos if todo['status'] == 'completed']
+        mock_table.query.return_value = {'Items': completed}
         
         response = client.get('/todos?status=completed')
         assert response.status_code == 200
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert len(data['todos']) == 1
         assert data['status_filter'] == 'completed'
         mock_table.query.assert_called_once()
 
-    def test_get_todo_success(self, client, mock_table):
+    def test_get_todo_success(self, client, mock_table, todo_id):
         """Test getting a specific todo - success"""
-        todo_id = str(uuid.uuid4())
         sample_todo = {
             'todo_id': todo_id,
             'title': 'Test Todo',
             'description': 'Test description',
-            'status': 'pending'
+            'status': 'pending',
+            'entity_type': 'todo'
         }
         mock_table.get_item.return_value = {'Item': sample_todo}
         
         response = client.get(f'/todos/{todo_id}')
         assert response.status_code == 200
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['todo_id'] == todo_id
         assert data['title'] == 'Test Todo'
+        assert 'entity_type' not in data
 
-    def test_get_todo_not_found(self, client, mock_table):
+    def test_get_todo_decimal_attributes(self, client, mock_table, todo_id):
+        """Test that DynamoDB Decimal numbers serialize as JSON numbers"""
+        mock_table.get_item.return_value = {
+            'Item': {'todo_id': todo_id, 'priority': Decimal('2'), 'progress': Decimal('0.5')}
+        }
+        
+        response = client.get(f'/todos/{todo_id}')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        
+        data = response.get_json()
+        assert data['priority'] == 2
+        assert data['progress'] == 0.5
+
+    def test_get_todo_large_decimal_attributes(self, client, mock_table, todo_id):
+        """Test that Decimals beyond the 64-bit integer range serialize as strings"""
+        mock_table.get_item.return_value = {
+            'Item': {'todo_id': todo_id, 'big': Decimal('1' * 30), 'max': Decimal(2 ** 64 - 1)}
+        }
+        
+        response = client.get(f'/todos/{todo_id}')
+        assert response.status_code == 200
+        
+        data = response.get_json()
+        assert data['big'] == '1' * 30
+        assert data['max'] == 2 ** 64 - 1
+
+    def test_get_todo_not_found(self, client, mock_table, todo_id):
         """Test getting a non-existent todo"""
-        todo_id = str(uuid.uuid4())
         mock_table.get_item.return_value = {}
         
         response = client.get(f'/todos/{todo_id}')
         assert response.status_code == 404
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'error' in data
 
+    def test_get_todo_cached(self, client, mock_table, todo_id):
+        """Test that repeated reads of a todo are served from the cache"""
+        mock_table.get_item.return_value = {'Item': {'todo_id': todo_id, 'title': 'Cached'}}
+        
+        assert client.get(f'/todos/{todo_id}').status_code == 200
+        assert client.get(f'/todos/{todo_id}').status_code == 200
+        mock_table.get_item.assert_called_once()
+
+    def test_list_todos_cache_invalidated_on_write(self, client, mock_table, sample_todo):
+        """Test that creating a todo invalidates cached listings"""
+        mock_table.query.return_value = {'Items': []}
+        
+        client.get('/todos')
+        client.get('/todos')
+        assert mock_table.query.call_count == 1
+        
+        client.post('/todos', json=dict(sample_todo))
+        client.get('/todos')
+        assert mock_table.query.call_count == 2
+
     def test_create_todo_success(self, client, mock_table, sample_todo):
         """Test creating a new todo - success"""
         mock_table.put_item.return_value = {}
         
-        response = client.post('/todos',
-                             data=json.dumps(sample_todo),
-                             content_type='application/json')
+        response = client.post('/todos', json=dict(sample_todo))
         assert response.status_code == 201
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['title'] == sample_todo['title']
         assert data['description'] == sample_todo['description']
         assert data['status'] == sample_todo['status']
         assert 'todo_id' in data
         assert 'created_at' in data
         assert 'updated_at' in data
+        assert 'entity_type' not in data
+        assert mock_table.put_item.call_args.kwargs['Item']['entity_type'] == 'todo'
+
+    def test_create_todos_batch_success(self, client, mock_table, sample_todo):
+        """Test creating todos in bulk through the batch writer"""
+        batch = mock_table.batch_writer.return_value.__enter__.return_value
+        
+        response = client.post('/todos/batch', json=[dict(sample_todo), {'title': 'Second'}])
+        assert response.status_code == 201
+        
+        data = response.get_json()
+        todos, count = todos_and_count(data)
+        assert count == 2
+        assert todos[1]['title'] == 'Second'
+        assert batch.put_item.call_count == 2
+        mock_table.put_item.assert_not_called()
+
+    def test_create_todos_batch_failure_invalidates_cache(self, client, mock_table, sample_todo):
+        """Test that a partially written batch does not leave stale listings cached"""
+        mock_table.query.return_value = {'Items': []}
+        client.get('/todos')
+        
+        batch = mock_table.batch_writer.return_value.__enter__.return_value
+        batch.put_item.side_effect = [None, ClientError(
+            {'Error': {'Code': 'ProvisionedThroughputExceededException'}}, 'BatchWriteItem'
+        )]
+        response = client.post('/todos/batch', json=[dict(sample_todo), {'title': 'Second'}])
+        assert response.status_code >= 400
+        
+        client.get('/todos')
+        assert mock_table.query.call_count == 2
+
+    def test_create_todos_batch_invalid_item(self, client, mock_table, sample_todo):
+        """Test that one invalid item rejects the whole batch"""
+        response = client.post('/todos/batch', json=[dict(sample_todo), {'description': 'No title'}])
+        assert response.status_code == 400
+        
+        data = response.get_json()
+        assert data['error'].startswith('Item 1:')
+        mock_table.batch_writer.assert_not_called()
 
     def test_create_todo_invalid_json(self, client):
         """Test creating todo with invalid JSON"""
@@ -173,22 +305,21 @@ class TestTodoAPI:
                              data='invalid json',
                              content_type='application/json')
         assert response.status_code == 400
+        assert 'valid JSON' in response.get_json()['error']
 
     def test_create_todo_missing_content_type(self, client, sample_todo):
         """Test creating todo without JSON content type"""
-        response = client.post('/todos', data=json.dumps(sample_todo))
+        response = client.post('/todos', data=json.dumps(dict(sample_todo)))
         assert response.status_code == 400
 
     def test_create_todo_missing_title(self, client, mock_table):
         """Test creating todo without title"""
         invalid_todo = {'description': 'No title', 'status': 'pending'}
         
-        response = client.post('/todos',
-                             data=json.dumps(invalid_todo),
-                             content_type='application/json')
+        response = client.post('/todos', json=invalid_todo)
         assert response.status_code == 400
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'Title is required' in data['error']
 
     def test_create_todo_invalid_status(self, client, mock_table):
@@ -199,84 +330,130 @@ class TestTodoAPI:
             'status': 'invalid_status'
         }
         
-        response = client.post('/todos',
-                             data=json.dumps(invalid_todo),
-                             content_type='application/json')
+        response = client.post('/todos', json=invalid_todo)
         assert response.status_code == 400
         
-        data = json.loads(response.data)
-        assert 'Status must be one of' in data['error']
+        data = response.get_json()
+        assert data['error'] == 'Status must be one of: pending, completed, archived'
 
-    def test_update_todo_success(self, client, mock_table, sample_todo):
+    def test_update_todo_success(self, client, mock_table, sample_todo, todo_id):
         """Test updating an existing todo - success"""
-        todo_id = str(uuid.uuid4())
-        existing_todo = {
-            'todo_id': todo_id,
-            'title': 'Old Title',
-            'created_at': '2023-01-01T00:00:00Z'
-        }
-        mock_table.get_item.return_value = {'Item': existing_todo}
-        mock_table.put_item.return_value = {}
-        
         updated_data = {
             'title': 'Updated Title',
             'description': 'Updated description',
             'status': 'completed'
         }
+        existing_todo = {
+            'todo_id': todo_id,
+            'created_at': '2023-01-01T00:00:00Z',
+            'updated_at': '2023-01-02T00:00:00Z',
+            **updated_data
+        }
+        mock_table.update_item.return_value = {'Attributes': existing_todo}
         
-        response = client.put(f'/todos/{todo_id}',
-                            data=json.dumps(updated_data),
-                            content_type='application/json')
+        response = client.put(f'/todos/{todo_id}', json=updated_data)
         assert response.status_code == 200
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['title'] == 'Updated Title'
         assert data['status'] == 'completed'
         assert data['created_at'] == existing_todo['created_at']
+        mock_table.get_item.assert_not_called()
+        assert mock_table.update_item.call_args.kwargs['ConditionExpression'] == 'attribute_exists(todo_id)'
+        update_kwargs = mock_table.update_item.call_args.kwargs
+        assert '#entity_type = :entity_type' in update_kwargs['UpdateExpression']
+        assert update_kwargs['ExpressionAttributeValues'][':entity_type'] == 'todo'
 
-    def test_update_todo_not_found(self, client, mock_table, sample_todo):
+    def test_update_todo_not_found(self, client, mock_table, sample_todo, todo_id):
         """Test updating a non-existent todo"""
-        todo_id = str(uuid.uuid4())
-        mock_table.get_item.return_value = {}
+        mock_table.update_item.side_effect = ClientError(
+            {'Error': {'Code': 'ConditionalCheckFailedException'}}, 'UpdateItem'
+        )
         
-        response = client.put(f'/todos/{todo_id}',
-                            data=json.dumps(sample_todo),
-                            content_type='application/json')
+        response = client.put(f'/todos/{todo_id}', json=dict(sample_todo))
         assert response.status_code == 404
+        assert response.get_json()['error'] == 'Todo not found'
 
-    def test_delete_todo_success(self, client, mock_table):
+    def test_delete_todo_success(self, client, mock_table, todo_id):
         """Test deleting an existing todo - success"""
-        todo_id = str(uuid.uuid4())
-        existing_todo = {'todo_id': todo_id, 'title': 'Test Todo'}
-        mock_table.get_item.return_value = {'Item': existing_todo}
         mock_table.delete_item.return_value = {}
         
         response = client.delete(f'/todos/{todo_id}')
         assert response.status_code == 200
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'deleted successfully' in data['message']
 
-    def test_delete_todo_not_found(self, client, mock_table):
+    def test_delete_todo_not_found(self, client, mock_table, todo_id):
         """Test deleting a non-existent todo"""
-        todo_id = str(uuid.uuid4())
-        mock_table.get_item.return_value = {}
+        mock_table.delete_item.side_effect = ClientError(
+            {'Error': {'Code': 'ConditionalCheckFailedException'}}, 'DeleteItem'
+        )
         
         response = client.delete(f'/todos/{todo_id}')
         assert response.status_code == 404
 
-    def test_invalid_endpoint(self, client):
-        """Test accessing invalid endpoint"""
-        response = client.get('/invalid-endpoint')
-        assert response.status_code == 404
+    def test_lambda_handler_api_gateway_event(self, mock_table):
+        """Test that API Gateway events are routed to the Flask app"""
+        pytest.importorskip('apig_wsgi')
+        mock_table.table_status = 'ACTIVE'
+        event = {
+            'httpMethod': 'GET',
+            'path': '/health',
+            'headers': {'Host': 'example.com'},
+            'queryStringParameters': None,
+            'body': None,
+            'isBase64Encoded': False,
+            'requestContext': {}
+        }
         
-        data = json.loads(response.data)
-        assert 'not found' in data['error'].lower()
+        response = lambda_handler(event, None)
+        assert response['statusCode'] == 200
+        assert json.loads(response['body'])['status'] == 'healthy'
 
-    def test_method_not_allowed(self, client):
-        """Test using invalid HTTP method"""
-        response = client.patch('/todos')
-        assert response.status_code == 405
+    def test_cors_headers(self, client, mock_table):
+        """Test that responses and preflight requests carry CORS headers"""
+        mock_table.get_item.return_value = {}
+        
+        response = client.get('/todos/missing')
+        assert response.headers['Access-Control-Allow-Origin'] == '*'
+        
+        response = client.options('/todos', headers={
+            'Origin': 'https://example.com',
+            'Access-Control-Request-Method': 'POST'
+        })
+        assert response.status_code == 200
+        assert response.headers['Access-Control-Allow-Origin'] == '*'
+        assert 'POST' in response.headers['Access-Control-Allow-Methods']
+        assert 'Content-Type' in response.headers['Access-Control-Allow-Headers']
+
+    def test_unexpected_error(self, client, mock_table):
+        """Test that unexpected errors are returned as a JSON 500"""
+        mock_table.get_item.side_effect = RuntimeError("boom")
+        
+        response = client.get('/todos/some-id')
+        assert response.status_code == 500
+        assert response.get_json()['error'] == 'Internal server error'
+
+    def test_dynamodb_error(self, client, mock_table):
+        """Test that DynamoDB errors are mapped to HTTP responses"""
+        mock_table.query.side_effect = ClientError(
+            {'Error': {'Code': 'ValidationException'}}, 'Query'
+        )
+        
+        response = client.get('/todos')
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'Invalid request data'
+
+    @pytest.mark.parametrize('method, path, status, message', [
+        ('GET', '/invalid-endpoint', 404, 'not found'),
+        ('PATCH', '/todos', 405, 'not allowed'),
+    ])
+    def test_error_routes(self, client, method, path, status, message):
+        """Test unknown endpoints and unsupported methods return JSON errors"""
+        response = client.open(path, method=method)
+        assert response.status_code == status
+        assert message in response.get_json()['error'].lower()
 
 
 class TestValidation:
@@ -290,69 +467,38 @@ class TestValidation:
             'status': 'pending'
         }
         
-        result = validate_todo_data(valid_data)
-        assert result['title'] == 'Test Todo'
-        assert result['description'] == 'Test description'
-        assert result['status'] == 'pending'
+        assert validate_todo_data(valid_data) == ('Test Todo', 'Test description', 'pending')
 
     def test_validate_todo_data_minimal(self):
         """Test validation with minimal data"""
         minimal_data = {'title': 'Test Todo'}
         
-        result = validate_todo_data(minimal_data)
-        assert result['title'] == 'Test Todo'
-        assert result['description'] == ''
-        assert result['status'] == 'pending'
-
-    def test_validate_todo_data_empty_title(self):
-        """Test validation with empty title"""
-        invalid_data = {'title': '   ', 'description': 'Test'}
-        
-        with pytest.raises(TodoValidationError, match="Title is required"):
-            validate_todo_data(invalid_data)
-
-    def test_validate_todo_data_long_title(self):
-        """Test validation with title too long"""
-        invalid_data = {'title': 'x' * 201}
-        
-        with pytest.raises(TodoValidationError, match="Title must be"):
-            validate_todo_data(invalid_data)
-
-    def test_validate_todo_data_long_description(self):
-        """Test validation with description too long"""
-        invalid_data = {
-            'title': 'Test Todo',
-            'description': 'x' * 1001
-        }
-        
-        with pytest.raises(TodoValidationError, match="Description must be"):
+        assert validate_todo_data(minimal_data) == ('Test Todo', '', 'pending')
+
+    @pytest.mark.parametrize('invalid_data, message', [
+        ({'title': '   ', 'description': 'Test'}, "Title is required"),
+        ({'title': 'x' * 201}, "Title must be"),
+        ({'title': 'Test Todo', 'description': 'x' * 1001}, "Description must be"),
+        ({'title': 'Test Todo', 'status': 'invalid'}, "Status must be one of"),
+        ("not a dict", "must be a JSON object"),
+        ({'title': 123}, "Title must be a string"),
+        ({'title': 'Test', 'description': ['a']}, "Description must be a string"),
+        ({'title': 'Test', 'status': None}, "Status must be one of"),
+    ])
+    def test_validate_todo_data_invalid(self, invalid_data, message):
+        """Test that invalid todo data is rejected with a clear message"""
+        with pytest.raises(TodoValidationError, match=message):
             validate_todo_data(invalid_data)
 
-    def test_validate_todo_data_invalid_status(self):
-        """Test validation with invalid status"""
-        invalid_data = {
-            'title': 'Test Todo',
-            'status': 'invalid'
-        }
-        
-        with pytest.raises(TodoValidationError, match="Status must be one of"):
-            validate_todo_data(invalid_data)
-
-    def test_validate_todo_data_not_dict(self):
-        """Test validation with non-dictionary input"""
-        with pytest.raises(TodoValidationError, match="must be a JSON object"):
-            validate_todo_data("not a dict")
-
-    def test_create_todo_item(self):
+    def test_build_new_item(self, todo_id):
         """Test todo item creation"""
-        todo_id = str(uuid.uuid4())
-        validated_data = {
-            'title': 'Test Todo',
+        data = {
+            'title': ' Test Todo ',
             'description': 'Test description',
-            'status': 'pending'
+            'status': 'Pending'
         }
         
-        result = create_todo_item(todo_id, validated_data)
+        result = build_new_item(data, todo_id)
         
         assert result['todo_id'] == todo_id
         assert result['title'] == 'Test Todo'
@@ -362,6 +508,136 @@ class TestValidation:
         assert 'updated_at' in result
         assert result['created_at'] == result['updated_at']
 
+    def test_build_new_item_defaults(self):
+        """Test that the ID and timestamp are generated when not given"""
+        result = build_new_item({'title': 'Test Todo'}, now='2023-01-01T00:00:00.000000Z')
+        
+        assert len(result['todo_id']) == 32
+        assert result['created_at'] == '2023-01-01T00:00:00.000000Z'
+        
+        with pytest.raises(TodoValidationError, match="Title is required"):
+            build_new_item({'description': 'No title'})
+
+    def test_parse_limit(self):
+        """Test list page size parsing and clamping"""
+        assert parse_limit('10') == 10
+        assert parse_limit('100') == 100
+        assert parse_limit('') == 50
+        assert parse_limit('0') == 1
+        assert parse_limit('101') == 100
+        assert parse_limit('1000000') == 100
+        assert parse_limit('-5') == 50
+        assert parse_limit('abc') == 50
+        assert parse_limit('\u00b2') == 50
+
+    def test_iso_now_fixed_width(self):
+        """Test that timestamps always include microseconds"""
+        with patch('todo_api.datetime') as mock_datetime:
+            mock_datetime.utcnow.return_value = datetime(2023, 1, 1, 12, 0, 0)
+            assert iso_now() == '2023-01-01T12:00:00.000000Z'
+            mock_datetime.utcnow.return_value = datetime(2023, 1, 1, 12, 0, 0, 120000)
+            assert iso_now() == '2023-01-01T12:00:00.120000Z'
+
+    def test_generate_todo_id(self):
+        """Test that todo IDs are unique 32-character hex strings"""
+        todo_id = generate_todo_id()
+        assert len(todo_id) == 32
+        int(todo_id, 16)
+        assert generate_todo_id() != todo_id
+
+
+class TestDataResource:
+    """Test suite for routing item operations through DAX"""
+
+    def test_dynamodb_used_without_dax_endpoint(self, monkeypatch):
+        """Test that the DynamoDB resource is used when DAX is not configured"""
+        monkeypatch.delenv('DAX_ENDPOINT', raising=False)
+        dynamodb_resource = MagicMock()
+        
+        assert create_data_resource(dynamodb_resource) is dynamodb_resource
+
+    def test_dax_endpoint_routes_items_through_dax(self, monkeypatch):
+        """Test that DAX serves items while DynamoDB keeps the health check"""
+        dax_client = MagicMock()
+        monkeypatch.setitem(sys.modules, 'amazondax',
+                            types.SimpleNamespace(AmazonDaxClient=dax_client))
+        monkeypatch.setenv('DAX_ENDPOINT', 'dax://example.cluster')
+        
+        # Load a separate copy so the module-level wiring runs with DAX
+        # enabled, leaving the todo_api module used by other tests untouched
+        spec = importlib.util.spec_from_file_location('todo_api_dax', todo_api.__file__)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        
+        dax_client.resource.assert_called_once_with(endpoint_url='dax://example.cluster')
+        assert module.table is dax_client.resource.return_value.Table.return_value
+        assert module.control_table is not None
+        assert module.control_table.name == module.table_name
+        
+        module.control_table = MagicMock(table_status='ACTIVE')
+        assert module.get_table_status() == 'ACTIVE'
+        module.control_table.reload.assert_called_once()
+        module.table.reload.assert_not_called()
+
+    def test_no_control_table_without_dax(self):
+        """Test that the health check probes the item table without DAX"""
+        assert todo_api.data_resource is todo_api.dynamodb
+        assert todo_api.control_table is None
+
+
+class TestTTLCache:
+    """Test suite for the in-process read cache"""
+
+    def test_entries_expire(self):
+        """Test that entries are dropped once the TTL has passed"""
+        cache = TTLCache(maxsize=10, ttl=5)
+        with patch('todo_api.time.monotonic', return_value=100.0):
+            cache.set('key', 'value')
+            assert cache.get('key') == 'value'
+        with patch('todo_api.time.monotonic', return_value=106.0):
+            assert cache.get('key') is None
+
+    def test_least_recently_used_evicted(self):
+        """Test that the oldest entry is evicted when the cache is full"""
+        cache = TTLCache(maxsize=2, ttl=5)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+
+    def test_concurrent_access(self):
+        """Test that concurrent reads, writes and clears do not raise"""
+        cache = TTLCache(maxsize=4, ttl=5)
+        errors = []
+        
+        def worker(offset):
+            try:
+                for i in range(2000):
+                    key = (i + offset) % 8
+                    cache.set(key, i)
+                    cache.get(key)
+                    if i % 50 == 0:
+                        cache.clear()
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+
+    def test_zero_ttl_disables_cache(self):
+        """Test that a TTL of zero disables caching"""
+        cache = TTLCache(maxsize=10, ttl=0)
+        cache.set('key', 'value')
+        assert cache.get('key') is None
+
 
 if __name__ == '__main__':
     pytest.main([__file__])
\ No newline at end of file
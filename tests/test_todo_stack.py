@@ -0,0 +1,104 @@
+"""
+Unit tests for TodoStack
+
+Tests the main application stack wiring, including integration with the
+nested database stack.
+"""
+
+import pytest
+
+
+class TestTodoStack:
+    """Test suite for TodoStack"""
+
+    @classmethod
+    def setup_class(cls):
+        """Build and synthesize the dev stack once; the tests only inspect it"""
+        # Imported here so runs that deselect these tests skip loading the
+        # JSII runtime during collection
+        import aws_cdk as cdk
+        from aws_cdk import assertions
+        from infrastructure.todo_stack import TodoStack
+
+        cls.app = cdk.App()
+        cls.stack = TodoStack(
+            cls.app, "TestTodoStack",
+            env=cdk.Environment(region="us-east-1")
+        )
+        cls.template = assertions.Template.from_stack(cls.stack)
+
+    def test_database_nested_stack_created(self):
+        """Test that the database is deployed as a nested stack of TodoStack"""
+        from aws_cdk import Stack
+
+        stack = self.stack
+
+        assert stack.database_stack.nested
+        assert stack.database_stack.node.scope is stack
+        assert [
+            child.node.id for child in self.app.node.children
+            if Stack.is_stack(child)
+        ] == ["TestTodoStack"]
+
+        self.template.resource_count_is("AWS::CloudFormation::Stack", 1)
+
+    def test_stack_tags(self):
+        """Test that all stack tags are set once, with a single Project value"""
+        artifact = self.app.synth().get_stack_artifact(self.stack.artifact_id)
+        assert artifact.tags == {
+            "Project": "flask-todo-cdk",
+            "Environment": "dev",
+            "ManagedBy": "CDK"
+        }
+
+    def test_table_details_resolved_without_cross_stack_references(self):
+        """Test that table details are plain names/ARNs, not imports"""
+        stack = self.stack
+
+        assert stack.todo_table_name == "flask-todo-dev"
+        assert "Fn::ImportValue" not in str(stack.resolve(stack.todo_table_arn))
+        assert "table/flask-todo-dev" in str(stack.resolve(stack.todo_table_arn))
+        assert "role/flask-todo-lambda-dynamodb-role-dev" in str(
+            stack.resolve(stack.lambda_role_arn)
+        )
+
+    def test_prod_stack_uses_prod_database(self):
+        """Test that is_prod wires TodoStack to the production database stack"""
+        import aws_cdk as cdk
+        from aws_cdk import assertions
+        from infrastructure.todo_stack import TodoStack
+
+        app = cdk.App()
+        stack = TodoStack(
+            app, "TestTodoStackProd",
+            is_prod=True,
+            env=cdk.Environment(region="us-east-1")
+        )
+
+        template = assertions.Template.from_stack(stack.database_stack)
+        template.has_resource_properties("AWS::DynamoDB::Table", {
+            "TableName": "flask-todo-prod"
+        })
+
+    def test_environment_resolution(self):
+        """Test that is_prod and the environment context must agree"""
+        import aws_cdk as cdk
+        from infrastructure.todo_stack import TodoStack
+
+        # The stack id alone never selects production
+        app = cdk.App()
+        stack = TodoStack(app, "FlaskTodoCdkPreprod")
+        assert stack.todo_table_name == "flask-todo-dev"
+
+        app = cdk.App(context={"environment": "dev"})
+        stack = TodoStack(app, "FlaskTodoCdkDev")
+        assert stack.todo_table_name == "flask-todo-dev"
+
+        # An explicit is_prod must not be overridden by ambient context
+        app = cdk.App(context={"environment": "dev"})
+        with pytest.raises(ValueError, match="conflicts with is_prod=True"):
+            TodoStack(app, "FlaskTodoCdkProd", is_prod=True)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
\ No newline at end of file